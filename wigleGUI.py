@@ -19,10 +19,18 @@ What's new in this update
 
 import os
 import re
+import csv
+import math
 import json
 import time
+import queue
+import shutil
+import tempfile
 import threading
+import functools
+import collections
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 import tkinter as tk
@@ -37,11 +45,32 @@ except Exception:
     TkinterMapView = None
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry, make_headers
+
+# Optional fast JSON codec
+try:
+    import orjson
+except Exception:
+    orjson = None
+
+# Optional on-disk HTTP cache for repeated WiGLE queries
+try:
+    import requests_cache
+except Exception:
+    requests_cache = None
 
 APP_NAME = "WiGLE Unified GUI"
 STORE_DIR = Path.home() / ".wigle_gui"
 STORE_DIR.mkdir(parents=True, exist_ok=True)
 CRED_PATH = STORE_DIR / "credentials.json"
+HTTP_CACHE_PATH = STORE_DIR / "http_cache.sqlite"
+HTTP_CACHE_TTL = 3600  # seconds; server Cache-Control/ETag headers take precedence
+GEOCODE_PATH = STORE_DIR / "geocode.json"
+GEOCODE_TTL = 30 * 24 * 3600
+LOG_MAX_LINES = 2000  # status pane keeps only the most recent lines
+MCC_CACHE_SIZE = 128  # MCC/MNC lookups remembered per session
+TABLE_INSERT_BATCH = 500  # rows per Treeview insert hop from search workers to the Tk thread
 
 OSM_TILE_URL = "https://a.tile.openstreetmap.org/{z}/{x}/{y}.png"
 SAT_TILE_URL = "http://mt0.google.com/vt/lyrs=y&hl=en&x={x}&y={y}&z={z}"
@@ -57,19 +86,231 @@ ENDPOINTS = {
     "bt_detail":         "https://api.wigle.net/api/v2/bluetooth/detail",
 }
 
+_LATLON_RE = re.compile(r"^\s*([+-]?\d+(?:\.\d+)?)\s*[, ]\s*([+-]?\d+(?:\.\d+)?)\s*$")
+_CC_RE = re.compile(r"\(([A-Z]{2})\)\s*$")
+_BASENAME_RE = re.compile(r"[^A-Za-z0-9_-]+")
+_COLON_TABLE = str.maketrans("", "", ":")
+_COORD6_RE = re.compile(r"-?(?:0|[1-9]\d*)\.\d{6}")  # already in the "%.6f" form used for table/export coordinates
+
 # ---------------------- Utils ----------------------
 
+_XML_TABLE = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;", "'": "&apos;"})
+
 def xml_escape(text):
+    return ("" if text is None else str(text)).translate(_XML_TABLE)
+
+if orjson is not None:
+    def _dumps(data):
+        return orjson.dumps(data)
+    def _json_text(data):
+        return orjson.dumps(data).decode("utf-8")
+    _loads = orjson.loads
+else:
+    def _dumps(data):
+        return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    _json_text = functools.partial(json.dumps, ensure_ascii=False, separators=(",", ":"))
+    _loads = json.loads
+
+def safe_json_dump(path, data):
+    Path(path).write_bytes(_dumps(data))
+
+def atomic_write_bytes(path, data):
+    # temp file + os.replace, so readers never see a partial file
+    path = Path(path)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=path.name + ".", suffix=".tmp")
     try:
-        s = str(text)
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
+
+def _lonlat_to_xy(lon, lat, z):
+    scale = 256.0 * 2.0 ** z
+    s = max(min(math.sin(math.radians(lat)), 0.9999), -0.9999)
+    return (lon + 180.0) / 360.0 * scale, (0.5 - math.log((1 + s) / (1 - s)) / (4 * math.pi)) * scale
+
+def _xy_to_lonlat(x, y, z):
+    scale = 256.0 * 2.0 ** z
+    n = math.pi - 2.0 * math.pi * y / scale
+    return x / scale * 360.0 - 180.0, math.degrees(math.atan(math.sinh(n)))
+
+def split_cell_id(cell_id):
+    return dict(zip(("operator", "lac", "cid"), (cell_id or "").split("_")))
+
+def _first(d, *keys, default=""):
+    for k in keys:
+        v = d.get(k)
+        if v:
+            return v
+    return default
+
+def safe_json_stream(path, items, block_size=1 << 20):
+    # the list is never encoded whole; output is flushed in ~1 MiB blocks
+    with open(path, "wb") as f:
+        buf = bytearray(b"[")
+        sep = b""
+        for item in items:
+            buf += sep
+            buf += _dumps(item)
+            sep = b","
+            if len(buf) >= block_size:
+                f.write(buf)
+                buf.clear()
+        buf += b"]"
+        f.write(buf)
+
+def safe_json_load(path, default=None):
+    try:
+        return _loads(Path(path).read_bytes())
     except Exception:
-        s = ""
-    return (s.replace("&", "&amp;").replace("<", "&lt;")
-             .replace(">", "&gt;").replace('"', "&quot;").replace("'", "&apos;"))
+        return default
+
+# ---------------------- Geocoding ----------------------
+
+# Persisted Nominatim answers: {query: [lat, lon, epoch]}
+_GEOCODE_DISK = safe_json_load(GEOCODE_PATH, {})
+if not isinstance(_GEOCODE_DISK, dict):
+    _GEOCODE_DISK = {}
+_GEOCODE_LOCK = threading.Lock()
+
+def _geocode(q):
+    # _GEOCODE_DISK is the only memo: expired hits are refetched, misses never stored
+    hit = _GEOCODE_DISK.get(q)
+    if hit and time.time() - hit[2] < GEOCODE_TTL:
+        return (hit[0], hit[1])
+    r = requests.get("https://nominatim.openstreetmap.org/search",
+                     params={"q": q, "format":"json", "limit":1},
+                     headers={"User-Agent": HEADERS["User-Agent"]},
+                     timeout=15)
+    r.raise_for_status()
+    arr = r.json()
+    if not arr:
+        return None
+    latlon = (float(arr[0]["lat"]), float(arr[0]["lon"]))
+    with _GEOCODE_LOCK:
+        _GEOCODE_DISK[q] = [latlon[0], latlon[1], int(time.time())]
+        try:
+            safe_json_dump(GEOCODE_PATH, _GEOCODE_DISK)
+        except Exception:
+            pass
+    return latlon
 
-def safe_json_dump(path, data):
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+def geocode(query):
+    return _geocode(" ".join((query or "").split()).lower())
+
+# ---------------------- Background network worker ----------------------
+
+class _NetWorker:
+    # One daemon thread for blocking calls from Tk handlers; callback(result, error) runs via widget.after
+    _instance = None
+    _lock = threading.Lock()
+
+    def __init__(self):
+        self._q = queue.Queue()
+        self._thread = threading.Thread(target=self._loop, name="wigle-net", daemon=True)
+        self._thread.start()
+
+    @classmethod
+    def submit(cls, widget, callback, fn, *args):
+        with cls._lock:
+            if cls._instance is None:
+                cls._instance = cls()
+        cls._instance._q.put((widget, callback, fn, args))
+
+    def _loop(self):
+        while True:
+            widget, callback, fn, args = self._q.get()
+            result = error = None
+            try:
+                result = fn(*args)
+            except Exception as e:
+                error = e
+            try:
+                widget.after(0, callback, result, error)
+            except Exception:
+                pass  # widget destroyed / app closing
+
+# ---------------------- Export writers ----------------------
+
+class UnionCsvWriter:
+    # Columns are the union of keys seen; rows spool per header width and are padded in close()
+    def __init__(self, path):
+        self.path = Path(path)
+        self.headers = []
+        self.rows = 0
+        self._seen = set()
+        self._spools = []  # [(width, file, csv.writer)]
+
+    def write_records(self, records):
+        records = [e for e in records if isinstance(e, dict)]
+        if not records:
+            return
+        headers, seen = self.headers, self._seen
+        for e in records:
+            new = e.keys() - seen
+            if new:  # rare after the first page; keep first-seen order within the row
+                headers.extend(k for k in e if k in new); seen |= new
+        width = len(headers)
+        if not self._spools or self._spools[-1][0] != width:
+            f = tempfile.TemporaryFile("w+", newline="", encoding="utf-8")
+            self._spools.append((width, f, csv.writer(f)))
+        self._spools[-1][2].writerows(
+            [(_json_text(v) if isinstance(v, (dict, list)) else v) for v in (e.get(k, "") for k in headers)]
+            for e in records)
+        self.rows += len(records)
+
+    def close(self):
+        # False (no file written) when there was nothing to export
+        try:
+            if not self.rows or not self.headers:
+                return False
+            n = len(self.headers)
+            with open(self.path, "w", newline="", encoding="utf-8", buffering=1 << 20) as out:
+                w = csv.writer(out)
+                w.writerow(self.headers)
+                for width, f, _ in self._spools:
+                    f.seek(0)
+                    if width == n:
+                        shutil.copyfileobj(f, out)
+                    else:
+                        pad = [""] * (n - width)
+                        w.writerows(row + pad for row in csv.reader(f))
+            return True
+        finally:
+            for _, f, _ in self._spools:
+                f.close()
+            self._spools = []
+
+class KmlWriter:
+    def __init__(self, path):
+        self.path = Path(path)
+        self.points = 0
+        self._f = open(self.path, "wb", buffering=1 << 20)
+        self._f.write(b'<?xml version="1.0" encoding="UTF-8"?><kml xmlns="http://www.opengis.net/kml/2.2"><Document>')
+
+    def write_placemark(self, name, lat, lon, data_items, _esc=xml_escape):
+        parts = [f"<Placemark><name>{_esc(name)}</name><ExtendedData>"]
+        parts.extend(f'<Data name="{_esc(k)}"><value>{_esc(v)}</value></Data>' for k, v in data_items)
+        parts.append(f"</ExtendedData><Point><coordinates>{lon},{lat},0</coordinates></Point></Placemark>")
+        self._f.write("".join(parts).encode("utf-8"))
+        self.points += 1
+
+    def close(self):
+        # False (file removed) when no placemark was written
+        self._f.write(b"</Document></kml>")
+        self._f.close()
+        if not self.points:
+            try:
+                os.remove(self.path)
+            except OSError:
+                pass
+            return False
+        return True
 
 # ---------------------- Credentials & API client ----------------------
 
@@ -82,7 +323,7 @@ class CredentialManager:
 
     def load(self):
         try:
-            data = json.load(open(self.path, "r", encoding="utf-8"))
+            data = _loads(self.path.read_bytes())
             self.user = data.get("username", "") or ""
             self.token = data.get("token", "") or ""
         except Exception:
@@ -90,38 +331,64 @@ class CredentialManager:
             self.token = ""
 
     def save(self, username, token):
+        changed = (username or "", token or "") != (self.user, self.token)
         self.user = username or ""
         self.token = token or ""
+        if _SESSION is not None:
+            _SESSION.auth = (self.user, self.token) if self.ready() else None
+            # requests-cache keys ignore Authorization, so another account's cached answers must go
+            if changed and hasattr(_SESSION, "cache"):
+                try:
+                    _SESSION.cache.clear()
+                except Exception:
+                    pass
         try:
             self.path.parent.mkdir(parents=True, exist_ok=True)
-            json.dump({"username": self.user, "token": self.token}, open(self.path, "w", encoding="utf-8"))
+            atomic_write_bytes(self.path, _dumps({"username": self.user, "token": self.token}))
         except Exception as e:
             messagebox.showwarning("Credentials", f"Failed to save credentials: {e}")
 
     def ready(self):
         return bool(self.user and self.token)
 
+# One pooled Session for the whole app so every tab reuses the same keep-alive
+# connections. Auth is set when the session is built and refreshed by
+# CredentialManager.save, never per request.
+_SESSION = None
+_SESSION_LOCK = threading.Lock()
+
+def get_session(cred=None):
+    global _SESSION
+    if _SESSION is None:
+        with _SESSION_LOCK:
+            if _SESSION is None:
+                if requests_cache is not None:
+                    s = requests_cache.CachedSession(str(HTTP_CACHE_PATH), backend="sqlite",
+                                                     expire_after=HTTP_CACHE_TTL, cache_control=True,
+                                                     allowable_methods=("GET",))
+                else:
+                    s = requests.Session()
+                # Transient failures and rate limiting (429, honouring Retry-After) are retried with backoff
+                retry = Retry(total=3, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504),
+                              allowed_methods=("GET", "HEAD"), raise_on_status=False)
+                adapter = HTTPAdapter(pool_connections=32, pool_maxsize=64, max_retries=retry)
+                s.mount("https://", adapter)
+                s.mount("http://", adapter)
+                s.headers.update(HEADERS)
+                # Ask for every compression this urllib3 build can decode (gzip/deflate, plus br/zstd if installed)
+                s.headers["Accept-Encoding"] = make_headers(accept_encoding=True)["accept-encoding"]
+                if cred is not None and cred.ready():
+                    s.auth = (cred.user, cred.token)
+                _SESSION = s
+    return _SESSION
+
 class ApiClient:
     def __init__(self, cred: CredentialManager):
         self.cred = cred
-        self._session = None
 
     @property
     def session(self):
-        if self._session is None:
-            s = requests.Session()
-            from requests.adapters import HTTPAdapter
-            adapter = HTTPAdapter(pool_connections=32, pool_maxsize=64, max_retries=2)
-            s.mount("https://", adapter)
-            s.mount("http://", adapter)
-            s.headers.update(HEADERS)
-            if self.cred.ready():
-                s.auth = (self.cred.user, self.cred.token)
-            self._session = s
-        else:
-            if self.cred.ready():
-                self._session.auth = (self.cred.user, self.cred.token)
-        return self._session
+        return get_session(self.cred)
 
 # ---------------------- Country data ----------------------
 COUNTRY_LIST = [
@@ -181,17 +448,33 @@ COUNTRY_LIST = [
     ("Yemen","YE"),("Zambia","ZM"),("Zimbabwe","ZW")
 ]
 
+COUNTRY_DISPLAY = tuple(sorted((f"{name} ({code})" for (name, code) in COUNTRY_LIST), key=str.lower))
+_COUNTRY_CODE_BY_DISPLAY = {d: d[-3:-1] for d in COUNTRY_DISPLAY}
+# Pre-formatted Tcl list so each Combobox receives one string instead of re-converting the tuple
+_COUNTRY_TCL_LIST = " ".join("{%s}" % d for d in COUNTRY_DISPLAY)
+
 def build_country_display_list():
-    items = [f"{name} ({code})" for (name, code) in COUNTRY_LIST]
-    items.sort(key=lambda s: s.lower())
-    return items
+    return COUNTRY_DISPLAY
 
 def country_display_to_code(display: str) -> str:
-    m = re.search(r"\(([A-Z]{2})\)\s*$", display or "")
+    code = _COUNTRY_CODE_BY_DISPLAY.get(display)
+    if code is not None:
+        return code
+    m = _CC_RE.search(display or "")
     return m.group(1) if m else ""
 
 # ---------------------- Base tab classes ----------------------
 
+_ICONS = {}
+
+def _icons(root):
+    if not _ICONS:
+        for name, color in (("red", "#cc0000"), ("green", "#00aa00")):
+            img = tk.PhotoImage(master=root, width=12, height=12)
+            img.put(color, to=(0, 0, 12, 12))
+            _ICONS[name] = img
+    return _ICONS
+
 class BaseTab(ttk.Frame):
     def __init__(self, master, api: ApiClient, app=None):
         super().__init__(master)
@@ -204,9 +487,12 @@ class BaseTab(ttk.Frame):
         self.json_selected = False
         self.output_dir = None
         self.run_tag = None
+        self._log_queue = collections.deque(maxlen=5000)
+        self._log_pump_scheduled = False
 
-        self._img_red = tk.PhotoImage(width=12, height=12); self._img_red.put("#cc0000", to=(0,0,12,12))
-        self._img_green = tk.PhotoImage(width=12, height=12); self._img_green.put("#00aa00", to=(0,0,12,12))
+        icons = _icons(self.winfo_toplevel())
+        self._img_red = icons["red"]
+        self._img_green = icons["green"]
 
     def _toggle_btn(self, btn, flag_name):
         val = not getattr(self, flag_name)
@@ -227,25 +513,89 @@ class BaseTab(ttk.Frame):
         return outdir, tag
 
     def _log(self, text):
-        pass
-
-# -------- Basic Search Tab --------
+        # Safe from worker threads: lines are queued and written to self.status by one
+        # _flush_logs call per ~50 ms, so a burst of messages costs a single Tk insert.
+        s = str(text)
+        if not s.endswith("\n"):
+            s += "\n"
+        self._log_queue.append(s)
+        if not self._log_pump_scheduled:
+            self._log_pump_scheduled = True
+            try:
+                self.after(50, self._flush_logs)
+            except Exception:
+                self._log_pump_scheduled = False
+
+    def _flush_logs(self):
+        self._log_pump_scheduled = False
+        q = self._log_queue
+        lines = []
+        while q:
+            lines.append(q.popleft())
+        if not lines:
+            return
+        try:
+            self.status.configure(state="normal")
+            self.status.insert("end", "".join(lines))
+            self.status.delete("1.0", f"end - {LOG_MAX_LINES} lines")
+            self.status.configure(state="disabled")
+            self.status.see("end")
+        except Exception:
+            pass
 
-class BasicSearchTab(BaseTab):
-    def clear_results(self):
+    def _clear_status(self):
+        self._log_queue.clear()
         try:
-            self.status.delete('1.0', 'end')
+            self.status.configure(state="normal")
+            self.status.delete("1.0", "end")
+            self.status.configure(state="disabled")
         except Exception:
             pass
+
+    def _bulk_insert(self, rows):
+        # Tk thread only; talk to the Treeview command directly to skip ttk's per-call option formatting.
+        if not rows:
+            return
+        call = self.table.tk.call; w = self.table._w
+        # Columns stay fixed-width while rows go in; stretch is restored once at the end.
+        stretch = {}
+        for c in self.table["columns"]:
+            try:
+                stretch[c] = self.table.column(c, "stretch")
+                self.table.column(c, stretch=False)
+            except Exception:
+                pass
         try:
-            for iid in self.table.get_children():
-                self.table.delete(iid)
+            for vals in rows:
+                try:
+                    call(w, "insert", "", "end", "-values", vals)
+                except Exception:
+                    pass
+        finally:
+            for c, v in stretch.items():
+                try:
+                    self.table.column(c, stretch=v)
+                except Exception:
+                    pass
+
+    def _clear_table(self):
+        try:
+            self.table.delete(*self.table.get_children())
         except Exception:
             pass
+
+# -------- Basic Search Tab --------
+
+class BasicSearchTab(BaseTab):
+    def clear_results(self):
+        self._clear_status()
+        self._clear_table()
+        self._sel_cache = None
         self.page_files.clear()
 
     DEFAULT_CENTER = (20.0, 0.0)
     DEFAULT_ZOOM = 2
+    DATE_FIELDS = frozenset(("lastupdt", "firsttime", "lasttime"))
 
     def __init__(self, master, api: ApiClient, app, title="Search"):
         super().__init__(master, api, app)
@@ -267,13 +617,14 @@ class BasicSearchTab(BaseTab):
         for i, key in enumerate(self.param_fields):
             row = i // 2
             col = (i % 2) * 2
-            ttk.Label(param_frame, text=f"{key}:").grid(row=row, column=col, sticky="e", padx=(0,6), pady=2)
-            if key in ("lastupdt","firsttime","lasttime"):
+            ttk.Label(param_frame, text=key + ":").grid(row=row, column=col, sticky="e", padx=(0,6), pady=2)
+            if key in self.DATE_FIELDS:
                 rowf = ttk.Frame(param_frame); rowf.grid(row=row, column=col+1, sticky="w")
                 ent = ttk.Entry(rowf, width=26); ent.pack(side="left")
                 ttk.Button(rowf, text="Pick", width=6, command=lambda k=key: self._pick_date_into(k)).pack(side="left", padx=(6,0))
             elif key == "country" and hasattr(self, "country_values"):
-                ent = ttk.Combobox(param_frame, values=self.country_values, state="readonly", width=32)
+                values = _COUNTRY_TCL_LIST if self.country_values is COUNTRY_DISPLAY else self.country_values
+                ent = ttk.Combobox(param_frame, values=values, state="readonly", width=32)
                 ent.grid(row=row, column=col+1, sticky="w")
                 ent.set("")
             else:
@@ -290,6 +641,10 @@ class BasicSearchTab(BaseTab):
         ttk.Button(ctrl, text="Clear Params", command=self.clear_parameters).pack(side="left", padx=(6,0))
         ttk.Button(ctrl, text="Clear All", command=self.clear_all).pack(side="left", padx=(6,12))
 
+        self.bypass_cache = tk.BooleanVar(value=False)
+        if requests_cache is not None:
+            ttk.Checkbutton(ctrl, text="Bypass cache", variable=self.bypass_cache).pack(side="left", padx=(0,12))
+
         self.btn_csv = ttk.Button(ctrl, text="Export Full CSV", compound="left",
                                   image=self._img_red, command=lambda: self._toggle_btn(self.btn_csv, "csv_selected"))
         self.btn_csv.pack(side="left")
@@ -300,7 +655,7 @@ class BasicSearchTab(BaseTab):
                                    image=self._img_red, command=lambda: self._toggle_btn(self.btn_json, "json_selected"))
         self.btn_json.pack(side="left", padx=(6,0))
 
-        self.status = ScrolledText(left, width=60, height=10)
+        self.status = ScrolledText(left, width=60, height=10, state="disabled")
         self.status.grid(row=2, column=0, sticky="nsew", padx=4, pady=6)
 
         # RIGHT
@@ -342,7 +697,8 @@ class BasicSearchTab(BaseTab):
         ttk.Label(loc, text="Location:").pack(side="left")
         self.loc_entry = ttk.Entry(loc, width=64)
         self.loc_entry.pack(side="left")
-        self.loc_entry.bind("<Return>", lambda e: self._go_location())
+        self.loc_entry.bind("<Return>", lambda e: self._schedule_go())
+        self._geo_after = None
         ttk.Button(loc, text="Go", command=self._go_location).pack(side="left", padx=(6,0))
 
         tbl_box = ttk.LabelFrame(right, text="Results")
@@ -366,6 +722,8 @@ class BasicSearchTab(BaseTab):
             self.menu.add_separator()
             self.menu.add_command(label="Detailed Query", command=self._send_to_advanced)
         self.table.bind("<Button-3>", self._on_right_click)  # Right-click
+        self._sel_cache = None
+        self.table.bind("<<TreeviewSelect>>", self._refresh_sel_cache)
 
         # bbox state
         self._sat = False
@@ -379,11 +737,7 @@ class BasicSearchTab(BaseTab):
     # ----- helpers -----
 
     def _log(self, text):
-        s = str(text).replace("\\r\\n", "\n").replace("\\n", "\n")
-        if not s.endswith("\n"):
-            s += "\n"
-        self.status.insert("end", s)
-        self.status.see("end")
+        super()._log(str(text).replace("\\r\\n", "\n").replace("\\n", "\n"))
 
     def _pick_date_into(self, key):
         val = self._pick_date_dialog()
@@ -455,20 +809,10 @@ class BasicSearchTab(BaseTab):
                 center_lat, center_lon = self.map_widget.get_position()
                 z = getattr(self.map_widget, "zoom", self.DEFAULT_ZOOM)
                 w = getattr(self.map_widget, "width", 800); h = getattr(self.map_widget, "height", 600)
-                def lon_to_x(lon, z): return (lon + 180.0) / 360.0 * (256 * (2**z))
-                def lat_to_y(lat, z):
-                    import math as _m
-                    s = max(min(_m.sin(_m.radians(lat)), 0.9999), -0.9999)
-                    return (0.5 - _m.log((1+s)/(1-s))/(4*_m.pi)) * (256 * (2**z))
-                def x_to_lon(x, z): return x / (256 * (2**z)) * 360.0 - 180.0
-                def y_to_lat(y, z):
-                    import math as _m
-                    n = _m.pi - 2.0 * _m.pi * y / (256 * (2**z))
-                    return _m.degrees(_m.atan(0.5*(_m.exp(n)-_m.exp(-n))))
-                cx, cy = lon_to_x(center_lon, z), lat_to_y(center_lat, z)
+                cx, cy = _lonlat_to_xy(center_lon, center_lat, z)
                 half_w, half_h = w/2, h/2
-                lon_min, lon_max = x_to_lon(cx-half_w, z), x_to_lon(cx+half_w, z)
-                lat_min, lat_max = y_to_lat(cy+half_h, z), y_to_lat(cy-half_h, z)
+                lon_min, lat_max = _xy_to_lonlat(cx-half_w, cy-half_h, z)
+                lon_max, lat_min = _xy_to_lonlat(cx+half_w, cy+half_h, z)
             except Exception:
                 messagebox.showerror("BBox", "Unable to compute bounds")
                 return
@@ -518,26 +862,30 @@ class BasicSearchTab(BaseTab):
         self.btn_bbox.config(text="BBox")
         self._bbox_start = None
 
+    def _schedule_go(self):
+        # Coalesce repeated Enter presses into one lookup 400 ms after the last one
+        if self._geo_after:
+            self.after_cancel(self._geo_after)
+        self._geo_after = self.after(400, self._go_location)
+
     def _go_location(self):
+        # "Go" clicked while an Enter press is still pending: run once, now
+        if self._geo_after:
+            self.after_cancel(self._geo_after)
+        self._geo_after = None
         q = (self.loc_entry.get() or "").strip()
         if not q:
             return
-        m = re.match(r"^\s*([+-]?\d+(?:\.\d+)?)\s*[, ]\s*([+-]?\d+(?:\.\d+)?)\s*$", q)
-        latlon = None
+        m = _LATLON_RE.match(q)
         if m:
-            latlon = (float(m.group(1)), float(m.group(2)))
+            self._go_location_done((float(m.group(1)), float(m.group(2))), None)
         else:
-            try:
-                r = requests.get("https://nominatim.openstreetmap.org/search",
-                                 params={"q": q, "format":"json", "limit":1},
-                                 headers={"User-Agent": HEADERS["User-Agent"]},
-                                 timeout=15)
-                r.raise_for_status()
-                arr = r.json()
-                if arr:
-                    latlon = (float(arr[0]["lat"]), float(arr[0]["lon"]))
-            except Exception as e:
-                self._log(f"Nominatim error: {e}")
+            _NetWorker.submit(self, self._go_location_done, geocode, q)
+
+    def _go_location_done(self, latlon, error):
+        if error is not None:
+            self._log(f"Nominatim error: {error}")
+            return
         if latlon and TkinterMapView is not None:
             lat, lon = latlon
             self.map_widget.set_position(lat, lon)
@@ -547,30 +895,33 @@ class BasicSearchTab(BaseTab):
     # ----- Right-click menu handlers -----
 
     def _on_right_click(self, event):
-        # select row under cursor
+        # select row under cursor; clicks on empty space do nothing
         iid = self.table.identify_row(event.y)
-        if iid:
+        if not iid:
+            return
+        if iid not in self.table.selection():
             self.table.selection_set(iid)
-            try:
-                self.menu.tk_popup(event.x_root, event.y_root)
-            finally:
-                self.menu.grab_release()
+        self.menu.tk_popup(event.x_root, event.y_root)
 
-    def _get_selected_values(self):
+    def _refresh_sel_cache(self, event=None):
+        self._sel_cache = None
         sel = self.table.selection()
         if not sel:
-            return None
+            return
         vals = self.table.item(sel[0], "values")
         if not vals or len(vals) < 5:
-            return None
+            return
         # Column order for all basic tabs: [id/netid, name, lastupdt/gentype, lat, lon]
-        return {
+        self._sel_cache = {
             "id": vals[0],
             "name": vals[1],
             "lat": vals[3],
             "lon": vals[4],
         }
 
+    def _get_selected_values(self):
+        return self._sel_cache
+
     def _copy_mac_id(self):
         v = self._get_selected_values()
         if not v: return
@@ -623,13 +974,10 @@ class BasicSearchTab(BaseTab):
                 # WiFi/Cell Detail
                 if getattr(self, "is_cell_basic", False):
                     # Parse operator/lac/cid from id "OP_LAC_CID"
-                    parts = (v["id"] or "").split("_")
-                    if len(parts) >= 1 and detail.entries.get("operator") is not None:
-                        e = detail.entries["operator"]; e.delete(0, "end"); e.insert(0, parts[0])
-                    if len(parts) >= 2 and detail.entries.get("lac") is not None:
-                        e = detail.entries["lac"]; e.delete(0, "end"); e.insert(0, parts[1])
-                    if len(parts) >= 3 and detail.entries.get("cid") is not None:
-                        e = detail.entries["cid"]; e.delete(0, "end"); e.insert(0, parts[2])
+                    for k, part in split_cell_id(v["id"]).items():
+                        e = detail.entries.get(k)
+                        if e is not None:
+                            e.delete(0, "end"); e.insert(0, part)
                 else:
                     # WiFi: netid/bssid to netid
                     ent = detail.entries.get("netid")
@@ -652,15 +1000,9 @@ class BasicSearchTab(BaseTab):
 
     def clear_all(self):
         self.clear_parameters()
-        try:
-            self.status.delete("1.0", "end")
-        except Exception:
-            pass
-        try:
-            for iid in self.table.get_children():
-                self.table.delete(iid)
-        except Exception:
-            pass
+        self._clear_status()
+        self._clear_table()
+        self._sel_cache = None
         self.page_files.clear()
 
     def stop_search(self):
@@ -700,158 +1042,127 @@ class BasicSearchTab(BaseTab):
 
         self.clear_results()
         self._log(f"Output folder: {self.output_dir}")
+        bypass = self.bypass_cache.get()
 
         def worker():
-            session = self.api.session
-            try:
-                r0 = session.get(self.endpoint, params={**params, "resultsPerPage": params.get("resultsPerPage", 1)}, timeout=30)
-                r0.raise_for_status()
-                count = r0.json().get("totalResults", "unknown")
-                self._log(f"Total in DB: {count}")
-            except Exception as e:
-                self._log(f"Count check failed: {e}")
+            self._search_pages(self.api.session, params, bypass)
 
-            local = dict(params)
-            page = 1
-            total = 0
-            self.stop_event.clear()
+        self.search_thread = threading.Thread(target=worker, daemon=True)
+        self.search_thread.start()
 
-            # Log the submitted URL (initial request params)
-            try:
-                _req = requests.Request("GET", self.endpoint, params=local).prepare()
-                self._log(f"Submitted: {_req.url}")
-            except Exception as _e:
-                self._log(f"Submitted (could not build full URL): {self.endpoint} with params {local}")
-            while not self.stop_event.is_set():
+    def _search_pages(self, session, params, bypass_cache=False):
+        # Bypass is per request: the session (and its cache) is shared with every other tab.
+        opts = {"force_refresh": True} if (bypass_cache and hasattr(session, "cache")) else {}
+        try:
+            r0 = session.get(self.endpoint, params={**params, "resultsPerPage": params.get("resultsPerPage", 1)}, timeout=30, **opts)
+            r0.raise_for_status()
+            count = _loads(r0.content).get("totalResults", "unknown")
+            self._log(f"Total in DB: {count}")
+        except Exception as e:
+            self._log(f"Count check failed: {e}")
+
+        local = dict(params)
+        page = 1
+        total = 0
+        self.stop_event.clear()
+
+        # Exports are written page by page as results arrive; JSON pages are only kept on disk when requested.
+        keep_json = self.json_selected
+        base = self.output_dir / f"{self.save_prefix}-{self.run_tag}"
+        csv_out = kml_out = None
+        try:
+            if self.csv_selected:
+                csv_out = UnionCsvWriter(f"{base}.csv")
+            if self.kml_selected:
+                kml_out = KmlWriter(f"{base}.kml")
+        except Exception as e:
+            self._log(f"Failed to open export file: {e}")
+
+        # Log the submitted URL (initial request params)
+        try:
+            _req = requests.Request("GET", self.endpoint, params=local).prepare()
+            self._log(f"Submitted: {_req.url}")
+        except Exception as _e:
+            self._log(f"Submitted (could not build full URL): {self.endpoint} with params {local}")
+        # One-deep prefetch: the next page is requested as soon as its searchAfter
+        # cursor is known, while the current page is written, exported and rendered.
+        prefetch = ThreadPoolExecutor(max_workers=1)
+        fetch = lambda p: session.get(self.endpoint, params=p, timeout=60, **opts)
+        pending = prefetch.submit(fetch, dict(local))
+        try:
+            while pending is not None and not self.stop_event.is_set():
                 try:
-                    resp = session.get(self.endpoint, params=local, timeout=60)
+                    resp = pending.result()
                     resp.raise_for_status()
                 except Exception as e:
                     self._log(f"Request failed: {e}")
                     break
+                pending = None
                 data = {}
                 try:
-                    data = resp.json()
+                    data = _loads(resp.content)
                 except Exception:
                     pass
                 results = data.get("results", [])
                 if not results:
                     break
 
-                page_path = self.output_dir / f"{self.save_prefix}-{self.run_tag}-page_{page}.json"
-                try:
-                    safe_json_dump(page_path, results)
-                    self._log(f"Page {page}: {len(results)} results saved: {page_path}")
-                    self.page_files.append(str(page_path))
-                except Exception as e:
-                    self._log(f"Failed to write page {page}: {e}")
+                sa = data.get("search_after") or data.get("searchAfter")
+                if sa and not self.stop_event.is_set():
+                    local["searchAfter"] = sa
+                    pending = prefetch.submit(fetch, dict(local))
 
-                for r in results:
+                if keep_json:
+                    page_path = f"{base}-page_{page}.json"
                     try:
-                        vals = self.row_from_result(r)
-                        self.table.insert("", "end", values=vals)
-                    except Exception:
-                        pass
+                        safe_json_stream(page_path, results)
+                        self._log(f"Page {page}: {len(results)} results saved: {page_path}")
+                        self.page_files.append(page_path)
+                    except Exception as e:
+                        self._log(f"Failed to write page {page}: {e}")
+                else:
+                    self._log(f"Page {page}: {len(results)} results")
+                if csv_out:
+                    csv_out.write_records(results)
+                if kml_out:
+                    self._write_kml_records(kml_out, results)
+
+                rows = [self.row_from_result(r) for r in results if isinstance(r, dict)]
+                for i in range(0, len(rows), TABLE_INSERT_BATCH):
+                    self.after(0, self._bulk_insert, rows[i:i + TABLE_INSERT_BATCH])
                 total += len(results)
-
-                sa = data.get("search_after") or data.get("searchAfter")
-                if not sa:
-                    break
-                local["searchAfter"] = sa
                 page += 1
             self._log(f"Search complete: {total} results")
+        finally:
+            prefetch.shutdown(wait=False, cancel_futures=True)
+            if csv_out:
+                try:
+                    if csv_out.close():
+                        self._log(f"Full CSV exported: {csv_out.path}")
+                    else:
+                        self._log("CSV export: no headers.")
+                except Exception as e:
+                    self._log(f"CSV export failed: {e}")
+            if kml_out:
+                try:
+                    if kml_out.close():
+                        self._log(f"KML exported: {kml_out.path}")
+                    else:
+                        self._log("KML export: no points with lat/lon.")
+                except Exception as e:
+                    self._log(f"KML export failed: {e}")
 
-            try:
-                if self.csv_selected: self._export_csv()
-                if self.kml_selected: self._export_kml()
-            finally:
-                if not self.json_selected:
-                    removed = 0
-                    for p in list(self.page_files):
-                        try:
-                            os.remove(p)
-                            removed += 1
-                        except Exception:
-                            pass
-                    self.page_files.clear()
-                    self._log(f"Cleaned {removed} temporary JSON file(s).")
-
-        self.search_thread = threading.Thread(target=worker, daemon=True)
-        self.search_thread.start()
-
-    def _gather_pages(self):
-        return [str(self.output_dir / Path(p).name) for p in self.page_files if os.path.exists(p)]
-
-    def _export_csv(self):
-        files = self._gather_pages()
-        if not files:
-            self._log("No JSON pages to export CSV.")
-            return
-        headers, seen = [], set()
-        rows = []
-        for fp in files:
-            try:
-                data = json.load(open(fp, "r", encoding="utf-8"))
-            except Exception:
+    def _write_kml_records(self, kml, records):
+        put, enc = kml.write_placemark, _json_text
+        for e in records:
+            if not isinstance(e, dict):
                 continue
-            items = data if isinstance(data, list) else [data]
-            for e in items:
-                if isinstance(e, dict):
-                    for k in e.keys():
-                        if k not in seen:
-                            headers.append(k); seen.add(k)
-                    rows.append(e)
-        if not headers:
-            self._log("CSV export: no headers.")
-            return
-        csv_path = self.output_dir / f"{self.save_prefix}-{self.run_tag}.csv"
-        import csv
-        with open(csv_path, "w", newline="", encoding="utf-8") as f:
-            w = csv.writer(f)
-            w.writerow(headers)
-            for e in rows:
-                w.writerow([ (json.dumps(v, ensure_ascii=False, separators=(",", ":")) if isinstance(v,(dict,list)) else v) for v in (e.get(k,"") for k in headers) ])
-        self._log(f"Full CSV exported: {csv_path}")
-
-    def _export_kml(self):
-        files = self._gather_pages()
-        if not files:
-            self._log("No JSON pages to export KML.")
-            return
-        parts = ['<?xml version="1.0" encoding="UTF-8"?>','<kml xmlns="http://www.opengis.net/kml/2.2">','<Document>']
-        any_point = False
-        for fp in files:
-            try:
-                data = json.load(open(fp, "r", encoding="utf-8"))
-            except Exception:
+            lat = e.get("trilat") or e.get("lat") or e.get("latitude")
+            lon = e.get("trilong") or e.get("lon") or e.get("longitude")
+            if lat in (None, "") or lon in (None, ""):
                 continue
-            items = data if isinstance(data, list) else [data]
-            for e in items:
-                lat = e.get("trilat") or e.get("lat") or e.get("latitude")
-                lon = e.get("trilong") or e.get("lon") or e.get("longitude")
-                if lat in (None, "") or lon in (None, ""):
-                    continue
-                any_point = True
-                name = e.get("ssid") or e.get("name") or e.get("netid") or e.get("id") or ""
-                parts.append(f"<Placemark><name>{xml_escape(name)}</name>")
-                parts.append("<ExtendedData>")
-                for k, v in e.items():
-                    if isinstance(v, (dict, list)):
-                        try:
-                            v = json.dumps(v, ensure_ascii=False, separators=(",", ":"))
-                        except Exception:
-                            v = str(v)
-                    parts.append(f'<Data name="{xml_escape(k)}"><value>{xml_escape(v)}</value></Data>')
-                parts.append("</ExtendedData>")
-                parts.append(f"<Point><coordinates>{lon},{lat},0</coordinates></Point></Placemark>")
-        parts.append("</Document></kml>")
-        if not any_point:
-            self._log("KML export: no points with lat/lon.")
-            return
-        kml_path = self.output_dir / f"{self.save_prefix}-{self.run_tag}.kml"
-        with open(kml_path, "w", encoding="utf-8") as f:
-            f.write("".join(parts))
-        self._log(f"KML exported: {kml_path}")
+            name = e.get("ssid") or e.get("name") or e.get("netid") or e.get("id") or ""
+            put(name, lat, lon, ((k, enc(v) if isinstance(v, (dict, list)) else v) for k, v in e.items()))
 
 # -------- Specific Basic Tabs --------
 
@@ -874,7 +1185,7 @@ class WifiBasicTab(BasicSearchTab):
             "resultsPerPage","searchAfter"
         ]
         self.table_cols = [("netid","BSSID"),("ssid","SSID"),("lastupdt","Last Updated"),("trilat","Lat"),("trilong","Lon")]
-        self.country_values = build_country_display_list()
+        self.country_values = COUNTRY_DISPLAY
         self.copy_mac_label = "Copy MAC"
         self._send_target = "WiFi/Cell Detail"
         super().__init__(master, api, app, title="Wi‑Fi Basic")
@@ -898,7 +1209,7 @@ class BtBasicTab(BasicSearchTab):
             "resultsPerPage","searchAfter"
         ]
         self.table_cols = [("netid","BTID"),("name","Name"),("lastupdt","Last Updated"),("trilat","Lat"),("trilong","Lon")]
-        self.country_values = build_country_display_list()
+        self.country_values = COUNTRY_DISPLAY
         self.copy_mac_label = "Copy MAC"
         self._send_target = "BT Detail"
         super().__init__(master, api, app, title="BT Basic")
@@ -924,7 +1235,7 @@ class CellBasicTab(BasicSearchTab):
             "resultsPerPage","searchAfter"
         ]
         self.table_cols = [("id","ID"),("ssid","Name"),("gentype","GenType"),("trilat","Lat"),("trilong","Lon")]
-        self.country_values = build_country_display_list()
+        self.country_values = COUNTRY_DISPLAY
         self.copy_mac_label = "Copy ID"
         self._send_target = "WiFi/Cell Detail"
         self.is_cell_basic = True
@@ -935,15 +1246,27 @@ class CellBasicTab(BasicSearchTab):
 
 # -------- Detail Tabs --------
 
+class DetailRun:
+    # Per-lookup state, so batch lookups can run side by side; applied on the Tk thread in _detail_done
+    def __init__(self, params, output_dir, basename, want_csv=False, want_kml=False, want_json=False):
+        self.params = params
+        self.output_dir = output_dir
+        self.csv, self.kml, self.json = want_csv, want_kml, want_json
+        self.basename = basename
+        self.csv_done = False
+        self.kml_done = False
+        self.logs = []
+        self.rows = []
+        self.entries = None  # decoded results; the JSON, CSV and KML exports all read these
+        self.header = None  # column order from _collect_headers, shared by the CSV and KML exports
+
+    def log(self, text):
+        self.logs.append(str(text))
+
 class BaseDetailTab(BaseTab):
     def __init__(self, master, api: ApiClient, app, label="Detail", include_extra=False):
         super().__init__(master, api, app)
         self.endpoint = ENDPOINTS["network_detail"]
-        self.basename = None
-        self.page_files = []
-        self.merged_json = None
-        self.csv_done = False
-        self.kml_done = False
 
         main = ttk.Frame(self); main.pack(fill="both", expand=True)
         main.columnconfigure(0, weight=0, minsize=420)
@@ -964,6 +1287,9 @@ class BaseDetailTab(BaseTab):
         ttk.Label(brow, text="Batch file:").grid(row=0, column=0, sticky="e", padx=(0,6))
         ttk.Entry(brow, textvariable=self.batch_var, state="readonly").grid(row=0, column=1, sticky="ew")
         ttk.Button(brow, text="Browse…", command=self._browse_batch).grid(row=0, column=2, padx=(6,0))
+        self.batch_workers = tk.IntVar(value=4)
+        ttk.Label(brow, text="Parallel:").grid(row=1, column=0, sticky="e", padx=(0,6), pady=(4,0))
+        ttk.Spinbox(brow, from_=1, to=8, width=4, textvariable=self.batch_workers, state="readonly").grid(row=1, column=1, sticky="w", pady=(4,0))
 
         rowi = 2
         self.extra_keys = []
@@ -996,7 +1322,7 @@ class BaseDetailTab(BaseTab):
                                    image=self._img_red, command=lambda: self._toggle_btn(self.btn_json, "json_selected"))
         self.btn_json.pack(side="left", padx=(6,0))
 
-        self.status = ScrolledText(left, width=58, height=14); self.status.grid(row=2, column=0, sticky="ew", padx=6)
+        self.status = ScrolledText(left, width=58, height=14, state="disabled"); self.status.grid(row=2, column=0, sticky="ew", padx=6)
 
         right = ttk.Frame(main); right.grid(row=0, column=1, sticky="nsew")
         right.columnconfigure(0, weight=1); right.rowconfigure(0, weight=1)
@@ -1015,13 +1341,6 @@ class BaseDetailTab(BaseTab):
             self.table.heading(c, text=h); self.table.column(c, width=120, anchor="w", stretch=True)
         self.table.grid(row=0, column=0, sticky="nsew")
 
-    def _log(self, text):
-        s = str(text)
-        if not s.endswith("\n"):
-            s += "\n"
-        self.status.insert("end", s)
-        self.status.see("end")
-
     def _browse_batch(self):
         p = filedialog.askopenfilename(title="Select text file with IDs (one per line)",
                                        filetypes=[("Text files","*.txt *.list *.csv *.tsv"),("All files","*.*")])
@@ -1038,17 +1357,8 @@ class BaseDetailTab(BaseTab):
 
     def clear_all(self):
         self.clear_parameters()
-        try:
-            self.status.delete("1.0","end")
-        except Exception:
-            pass
-        try:
-            for iid in self.table.get_children():
-                self.table.delete(iid)
-        except Exception:
-            pass
-        self.page_files.clear(); self.merged_json=None; self.basename=None
-        self.csv_done=False; self.kml_done=False
+        self._clear_status()
+        self._clear_table()
         self.csv_selected=False; self.kml_selected=False; self.json_selected=False
         for b in (self.btn_csv, self.btn_kml, self.btn_json):
             try:
@@ -1063,10 +1373,14 @@ class BaseDetailTab(BaseTab):
         for p in (locs if isinstance(locs, list) else []):
             lat = p.get("lat") or p.get("latitude")
             lon = p.get("lon") or p.get("longitude")
-            if lat in (None, "") or lon in (None, ""):
+            if lat is None or lat == "" or lon is None or lon == "":
                 continue
             when = p.get("time") or p.get("lasttime") or p.get("lastupdt") or entry.get("lastupdt")
-            pts.append((f"{float(lat):.6f}", f"{float(lon):.6f}", str(when or "")))
+            if isinstance(lat, float): lat = format(lat, ".6f")
+            elif not (isinstance(lat, str) and _COORD6_RE.fullmatch(lat)): lat = "%.6f" % float(lat)
+            if isinstance(lon, float): lon = format(lon, ".6f")
+            elif not (isinstance(lon, str) and _COORD6_RE.fullmatch(lon)): lon = "%.6f" % float(lon)
+            pts.append((lat, lon, str(when or "")))
         return pts
 
     def _device_id(self, entry):
@@ -1091,6 +1405,11 @@ class BaseDetailTab(BaseTab):
         else:
             self._run_single()
 
+    @staticmethod
+    def _make_basename(params):
+        base = params.get("netid") or "_".join([f"{k}-{params[k]}" for k in ("operator","lac","cid","system","network","basestation") if k in params]) or "detail"
+        return _BASENAME_RE.sub("_", base.translate(_COLON_TABLE))
+
     def _run_single(self):
         params = {}
         for k,e in self.entries.items():
@@ -1106,16 +1425,14 @@ class BaseDetailTab(BaseTab):
         outdir.mkdir(parents=True, exist_ok=True)
         self.output_dir = outdir
 
-        base = params.get("netid") or "_".join([f"{k}-{params[k]}" for k in ("operator","lac","cid","system","network","basestation") if k in params]) or "detail"
-        self.basename = re.sub(r"[^A-Za-z0-9_-]+", "_", base.replace(":",""))
-
         from urllib.parse import urlencode
-        self.status.delete("1.0","end")
+        self._clear_status()
         self._log(f"Detail submitted: {ENDPOINTS['network_detail']}?{urlencode(params)}")
         self._log(f"Output folder: {self.output_dir}")
 
+        run = DetailRun(params, outdir, self._make_basename(params), self.csv_selected, self.kml_selected, self.json_selected)
         def worker():
-            self._do_detail(params, auto_export=True)
+            self.after(0, self._detail_done, self._do_detail(run))
         self.search_thread = threading.Thread(target=worker, daemon=True); self.search_thread.start()
 
     def _run_batch(self, path):
@@ -1137,97 +1454,92 @@ class BaseDetailTab(BaseTab):
         self._log(f"Batch file: {path}")
         self._log(f"Output folder: {self.output_dir}")
 
+        base_params = {}
+        for k,e in self.entries.items():
+            if k == "netid":
+                continue
+            v = (e.get() or "").strip()
+            if v:
+                base_params[k] = v
+        # Lookups run in parallel and name their files by basename, so IDs that collapse
+        # to the same basename (duplicates, "AA:BB" vs "AABB") would clobber each other.
+        jobs = {}
+        for nid in ids:
+            params = {**base_params, "netid": nid}
+            jobs.setdefault(self._make_basename(params), params)
+        if len(jobs) < len(ids):
+            self._log(f"Skipped {len(ids) - len(jobs)} ID(s) that duplicate an earlier entry's output name.")
+        flags = (self.csv_selected, self.kml_selected, self.json_selected)
+        workers = max(1, min(8, self.batch_workers.get()))
+
         def worker():
-            csv_ct = kml_ct = 0
-            for i, nid in enumerate(ids, start=1):
-                self.page_files.clear(); self.merged_json=None; self.basename=None
-                self.csv_done=False; self.kml_done=False
-                self.status.insert("end", "\n" + "="*64 + "\n"); self.status.insert("end", f"[{i}/{len(ids)}] NETID: {nid}\n"); self.status.insert("end", "="*64 + "\n"); self.status.see("end")
-                params = {}
-                for k,e in self.entries.items():
-                    if k == "netid":
-                        continue
-                    v = (e.get() or "").strip()
-                    if v:
-                        params[k] = v
-                params["netid"] = nid
-                self._do_detail(params, auto_export=True)
-                if self.csv_done: csv_ct += 1
-                if self.kml_done: kml_ct += 1
-            messagebox.showinfo("Batch complete", f"Created {csv_ct} CSV(s) and {kml_ct} KML(s).")
+            # Lookups are independent HTTP GETs; overlap them and apply results on the Tk thread as each finishes.
+            futures = []
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                for i, (basename, params) in enumerate(jobs.items(), start=1):
+                    run = DetailRun(params, outdir, basename, *flags)
+                    fut = pool.submit(self._do_detail, run)
+                    banner = f"[{i}/{len(jobs)}] NETID: {params['netid']}"
+                    fut.add_done_callback(lambda f, b=banner: self.after(0, self._detail_done, f.result(), b))
+                    futures.append(fut)
+            runs = [f.result() for f in futures]
+            csv_ct = sum(r.csv_done for r in runs); kml_ct = sum(r.kml_done for r in runs)
+            self.after(0, lambda: messagebox.showinfo("Batch complete", f"Created {csv_ct} CSV(s) and {kml_ct} KML(s)."))
         self.search_thread = threading.Thread(target=worker, daemon=True); self.search_thread.start()
 
-    def _do_detail(self, params, auto_export=False):
+    def _do_detail(self, run):
+        # worker thread; touches only `run`
+        try:
+            self._fetch_detail(run)
+        except Exception as e:
+            run.log(f"Detail lookup failed: {e}")
+        return run
+
+    def _fetch_detail(self, run):
+        params = run.params
         s = self.api.session
         # Log the fully prepared submitted URL
         try:
             _prep = requests.Request('GET', self.endpoint, params=params).prepare()
-            self._log(f'Submitted: {_prep.url}')
+            run.log(f'Submitted: {_prep.url}')
         except Exception as _e:
-            self._log(f'Submitted: {self.endpoint} with params {params}')
+            run.log(f'Submitted: {self.endpoint} with params {params}')
         try:
             r = s.get(self.endpoint, params=params, timeout=60); r.raise_for_status()
         except Exception as e:
-            self._log(f"Detail request failed: {e}")
+            run.log(f"Detail request failed: {e}")
             return
-        data = r.json()
+        data = _loads(r.content)
         results = data.get("results") or ([data.get("result")] if data.get("result") else [])
         if not results:
-            self._log("No results.")
+            run.log("No results.")
             return
+        run.entries = results
 
-        base = params.get("netid") or "_".join([f"{k}-{params[k]}" for k in ("operator","lac","cid","system","network","basestation") if k in params]) or "detail"
-        self.basename = re.sub(r"[^A-Za-z0-9_-]+","_", base.replace(":",""))
-        page_path = self.output_dir / f"{self.basename}-page_1.json"
-        try:
-            safe_json_dump(page_path, results)
-            self.page_files = [str(page_path)]
-            self._log(f"Saved RAW detail JSON page: {page_path}")
-        except Exception as ex:
-            self._log(f"Failed to write RAW JSON page: {ex}")
-
-        if self.json_selected and self.page_files:
+        if run.json:
+            out = run.output_dir / f"{run.basename}.json"
             try:
-                merged = self.output_dir / f"{self.basename}.json"
-                allr = []
-                for p in self.page_files:
-                    d = json.load(open(p,"r",encoding="utf-8"))
-                    allr.extend(d if isinstance(d,list) else [d])
-                safe_json_dump(merged, allr)
-                for p in list(self.page_files):
-                    try: os.remove(p)
-                    except Exception: pass
-                self.page_files.clear(); self.merged_json = str(merged)
-                self._log(f"Merged RAW JSON saved: {merged}")
+                safe_json_stream(out, results)
+                run.log(f"RAW JSON saved: {out}")
             except Exception as ex:
-                self._log(f"Failed to merge RAW JSON pages: {ex}")
+                run.log(f"Failed to write RAW JSON: {ex}")
 
+        devid, points, add = self._device_id, self._points_from_entry, run.rows.append
         for e in results:
-            device_id = self._device_id(e)
+            device_id = devid(e)
             name = e.get("ssid") or e.get("name") or e.get("operator") or ""
-            for lat, lon, when in self._points_from_entry(e):
-                self.table.insert("", "end", values=(device_id, name, lat, lon, when))
-
-        if auto_export:
-            if self.csv_selected: self.export_full_csv()
-            if self.kml_selected: self.export_kml()
-            if (not self.json_selected) and self.page_files:
-                removed = 0
-                for p in list(self.page_files):
-                    try:
-                        os.remove(p); removed += 1
-                    except Exception:
-                        pass
-                self.page_files.clear(); self._log(f"RAW JSON pages removed: {removed} files from {self.output_dir}")
-
-    def _raw_files(self):
-        if self.merged_json and os.path.isfile(self.merged_json): return [self.merged_json]
-        files = []
-        for fn in os.listdir(self.output_dir):
-            if fn.startswith(self.basename) and fn.endswith(".json"):
-                files.append(str(self.output_dir / fn))
-        page_like = [p for p in files if "-page_" in os.path.basename(p)]
-        return page_like or files
+            for lat, lon, when in points(e):
+                add((device_id, name, lat, lon, when))
+
+        if run.csv: self.export_full_csv(run)
+        if run.kml: self.export_kml(run)
+
+    def _detail_done(self, run, banner=None):
+        if banner:
+            self._log("\n" + "="*64); self._log(banner); self._log("="*64)
+        for line in run.logs:
+            self._log(line)
+        self._bulk_insert(run.rows)
 
     def _flatten_entry_point(self, entry, point):
         row = {}
@@ -1235,73 +1547,73 @@ class BaseDetailTab(BaseTab):
             for k, v in entry.items():
                 if k in ("locationData","locations"): continue
                 if isinstance(v, (str,int,float,bool)) or v is None: row[k] = v
-                else:
-                    try: row[k] = json.dumps(v, ensure_ascii=False, separators=(",", ":"))
-                    except Exception: row[k] = str(v)
+                elif isinstance(v, (dict,list)): row[k] = _json_text(v)
+                else: row[k] = str(v)
         if isinstance(point, dict):
             for k, v in point.items(): row[k] = v
         return row
 
-    def _rows_from_full_json(self):
-        files = self._raw_files(); rows=[]; header=[]; seen=set()
-        def push(k):
-            if k not in seen: seen.add(k); header.append(k)
-        for p in files:
-            try: data = json.load(open(p,"r",encoding="utf-8"))
-            except Exception: continue
-            entries = data if isinstance(data, list) else data.get("results", [])
-            for e in entries:
-                locs = e.get("locationData") or e.get("locations") or []
-                if isinstance(locs, dict): locs = [locs]
-                if not locs:
-                    row = self._flatten_entry_point(e, {}); [push(k) for k in row.keys()]; rows.append(row); continue
-                for pt in (locs if isinstance(locs, list) else []):
-                    row = self._flatten_entry_point(e, pt if isinstance(pt, dict) else {})
-                    lat = row.get("lat", row.get("latitude")); lon = row.get("lon", row.get("longitude"))
-                    if lat in (None,"") or lon in (None,""): continue
-                    [push(k) for k in row.keys()]; rows.append(row)
-        return rows, header
-
-    def export_full_csv(self):
-        if not self.output_dir or not self.basename:
-            messagebox.showinfo("Export Full CSV", "Run a search first.")
-            return
-        rows, header = self._rows_from_full_json()
-        if not rows:
-            messagebox.showinfo("Export Full CSV", "No rows to export from raw JSON.")
+    def _iter_entry_points(self, run):
+        # entries without locations yield (entry, {}); points without lat/lon are skipped
+        for e in run.entries or ():
+            if not isinstance(e, dict): continue
+            locs = e.get("locationData") or e.get("locations") or []
+            if isinstance(locs, dict): locs = [locs]
+            if not locs:
+                yield e, {}; continue
+            for pt in (locs if isinstance(locs, list) else []):
+                pt = pt if isinstance(pt, dict) else {}
+                row = collections.ChainMap(pt, e)
+                lat = row.get("lat", row.get("latitude")); lon = row.get("lon", row.get("longitude"))
+                if lat in (None,"") or lon in (None,""): continue
+                yield e, pt
+
+    def _iter_rows(self, run):
+        for e, pt in self._iter_entry_points(run):
+            yield self._flatten_entry_point(e, pt)
+
+    def _collect_headers(self, run):
+        if run.header is not None:
+            return run.header
+        header=[]; seen=set(); loc_keys = {"locationData","locations"}
+        for e, pt in self._iter_entry_points(run):
+            new = e.keys() - seen
+            if new:
+                new -= loc_keys
+                if new: header.extend(k for k in e if k in new); seen |= new
+            new = pt.keys() - seen
+            if new: header.extend(k for k in pt if k in new); seen |= new
+        run.header = header
+        return header
+
+    def export_full_csv(self, run):
+        header = self._collect_headers(run)
+        if not header:
+            run.log("Export Full CSV: no rows to export from raw JSON.")
             return
-        csv_path = self.output_dir / f"{self.basename}.csv"
-        import csv
-        with open(csv_path, "w", newline="", encoding="utf-8") as f:
+        csv_path = run.output_dir / f"{run.basename}.csv"
+        with open(csv_path, "w", newline="", encoding="utf-8", buffering=1 << 20) as f:
             w = csv.writer(f); w.writerow(header)
-            for r in rows: w.writerow([r.get(k,"") for k in header])
-        self.csv_done=True; self._log(f"Full CSV exported: {csv_path}")
+            w.writerows([r.get(k,"") for k in header] for r in self._iter_rows(run))
+        run.csv_done=True; run.log(f"Full CSV exported: {csv_path}")
 
-    def export_kml(self):
-        if not self.output_dir or not self.basename:
-            messagebox.showinfo("Export KML", "Run a search first.")
-            return
-        rows, header = self._rows_from_full_json()
-        any_point=False; parts=['<?xml version="1.0" encoding="UTF-8"?>','<kml xmlns="http://www.opengis.net/kml/2.2">','<Document>']
-        for r in rows:
-            lat = r.get("lat") or r.get("latitude"); lon = r.get("lon") or r.get("longitude")
-            if lat in (None,"") or lon in (None,""): continue
-            any_point=True
-            name = r.get("ssid") or r.get("name") or r.get("netid") or ""
-            parts.append(f"<Placemark><name>{xml_escape(name)}</name>")
-            parts.append("<ExtendedData>")
-            for k in header:
-                v = r.get(k,"")
-                parts.append(f'<Data name="{xml_escape(k)}"><value>{xml_escape(v)}</value></Data>')
-            parts.append("</ExtendedData>")
-            parts.append(f"<Point><coordinates>{lon},{lat},0</coordinates></Point></Placemark>")
-        parts.append("</Document></kml>")
-        if not any_point:
-            messagebox.showinfo("Export KML", "No points with lat/lon to write.")
+    def export_kml(self, run):
+        header = self._collect_headers(run)
+        kml = KmlWriter(run.output_dir / f"{run.basename}.kml")
+        put = kml.write_placemark
+        try:
+            for r in self._iter_rows(run):
+                lat = r.get("lat") or r.get("latitude"); lon = r.get("lon") or r.get("longitude")
+                if lat in (None,"") or lon in (None,""): continue
+                name = r.get("ssid") or r.get("name") or r.get("netid") or ""
+                get = r.get
+                put(name, lat, lon, ((k, get(k,"")) for k in header))
+        finally:
+            wrote = kml.close()
+        if not wrote:
+            run.log("Export KML: no points with lat/lon to write.")
             return
-        kml_path = self.output_dir / f"{self.basename}.kml"
-        with open(kml_path, "w", encoding="utf-8") as f: f.write("".join(parts))
-        self.kml_done=True; self._log(f"KML exported: {kml_path}")
+        run.kml_done=True; run.log(f"KML exported: {kml.path}")
 
 class BtDetailTab(BaseDetailTab):
     def __init__(self, master, api, app):
@@ -1323,15 +1635,16 @@ class MccMncTab(BaseTab):
         param = ttk.LabelFrame(left, text="MCC/MNC Parameters", padding=6); param.grid(row=0, column=0, sticky="ew", padx=6, pady=6)
         param.columnconfigure(1, weight=1)
         self.entries = {}
-        ttk.Label(param, text="MCC:").grid(row=0, column=0, sticky="e", padx=(0,6)); self.entries["mcc"] = ttk.Entry(param, width=18); self.entries["mcc"].grid(row=0, column=1, sticky="ew")
-        ttk.Label(param, text="MNC:").grid(row=1, column=0, sticky="e", padx=(0,6)); self.entries["mnc"] = ttk.Entry(param, width=18); self.entries["mnc"].grid(row=1, column=1, sticky="ew")
+        self.mcc_var = tk.StringVar(); self.mnc_var = tk.StringVar()
+        ttk.Label(param, text="MCC:").grid(row=0, column=0, sticky="e", padx=(0,6)); self.entries["mcc"] = ttk.Entry(param, width=18, textvariable=self.mcc_var); self.entries["mcc"].grid(row=0, column=1, sticky="ew")
+        ttk.Label(param, text="MNC:").grid(row=1, column=0, sticky="e", padx=(0,6)); self.entries["mnc"] = ttk.Entry(param, width=18, textvariable=self.mnc_var); self.entries["mnc"].grid(row=1, column=1, sticky="ew")
 
         btns = ttk.Frame(left); btns.grid(row=1, column=0, sticky="w", padx=6, pady=(0,6))
         ttk.Button(btns, text="Search", command=self.start_search).pack(side="left")
         ttk.Button(btns, text="Clear", command=self.clear_all).pack(side="left", padx=(6,0))
         ttk.Button(btns, text="Export Results CSV", command=self.export_csv).pack(side="left", padx=(12,0))
 
-        self.status = ScrolledText(left, width=50, height=10); self.status.grid(row=2, column=0, sticky="ew", padx=6)
+        self.status = ScrolledText(left, width=50, height=10, state="disabled"); self.status.grid(row=2, column=0, sticky="ew", padx=6)
 
         right = ttk.Frame(main); right.grid(row=0, column=1, sticky="nsew")
         right.columnconfigure(0, weight=1); right.rowconfigure(0, weight=1)
@@ -1343,104 +1656,136 @@ class MccMncTab(BaseTab):
         self.table.grid(row=0, column=0, sticky="nsew")
 
         self._raw_rows = []
-
-    def _log(self, text):
-        s = str(text)
-        if not s.endswith("\n"):
-            s += "\n"
-        self.status.insert("end", s); self.status.see("end")
+        self._busy = False
+        # Own worker, so slow lookups and fallbacks never queue behind (or block) geocoding on _NetWorker
+        self._search_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="wigle-mccmnc")
+        self._cache = collections.OrderedDict()  # (mcc, mnc) -> records, LRU
 
     def clear_all(self):
-        for e in self.entries.values():
-            try: e.delete(0, "end")
-            except Exception: pass
-        try: self.status.delete("1.0","end")
-        except Exception: pass
-        try:
-            for iid in self.table.get_children(): self.table.delete(iid)
-        except Exception: pass
+        self.mcc_var.set(""); self.mnc_var.set("")
+        self._clear_status()
+        self._clear_table()
         self._raw_rows = []
 
     def start_search(self):
         if not self.api.cred.ready():
             messagebox.showinfo("WiGLE Credentials", "Please set WiGLE credentials in Settings → WiGLE Credentials…")
             return
-        mcc = (self.entries["mcc"].get() or "").strip()
-        mnc = (self.entries["mnc"].get() or "").strip()
+        mcc = self.mcc_var.get().strip()
+        mnc = self.mnc_var.get().strip()
         if not (mcc or mnc):
             messagebox.showinfo("MCC/MNC", "Enter at least an MCC or an MCC + MNC.")
             return
+        if self._busy:
+            return
         self.clear_all()
+        key = (mcc, mnc)
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            self._log(f"Cache hit – {len(cached)} result(s) for mcc={mcc}&mnc={mnc}")
+            self._apply_results((cached, []), None)
+            return
         self._log(f"GET {ENDPOINTS['mccmnc']}?mcc={mcc}&mnc={mnc}")
-
-        def _extract_records(data, qp):
-            if isinstance(data, dict):
-                if isinstance(data.get("results"), list): return [r for r in data["results"] if isinstance(r, dict)]
-                if isinstance(data.get("result"), dict):  return [data["result"]]
-                recs = []
-                if qp.get("mcc") and qp.get("mnc"):
-                    mm = data.get(qp["mcc"])
-                    if isinstance(mm, dict) and isinstance(mm.get(qp["mnc"]), dict):
-                        return [mm[qp["mnc"]]]
-                for _mcc, m in data.items():
-                    if isinstance(m, dict):
-                        for _mnc, rec in m.items():
-                            if isinstance(rec, dict): recs.append(rec)
-                return recs
-            elif isinstance(data, list):
-                return [r for r in data if isinstance(r, dict)]
-            return []
-
+        self._busy = True
+        fut = self._search_pool.submit(self._do_search, mcc, mnc)
+        fut.add_done_callback(lambda f: self.after(0, self._search_done, f, key))
+
+    def _search_done(self, fut, key):
+        err = fut.exception()
+        self._apply_results(None if err else fut.result(), err, key=key)
+
+    @staticmethod
+    def _iter_records(data, qp):
+        # input is freshly decoded JSON, so exact type checks are safe
+        if type(data) is dict:
+            if type(data.get("results")) is list:
+                yield from (r for r in data["results"] if type(r) is dict); return
+            if type(data.get("result")) is dict:
+                yield data["result"]; return
+            if qp.get("mcc") and qp.get("mnc"):
+                mm = data.get(qp["mcc"])
+                if type(mm) is dict and type(mm.get(qp["mnc"])) is dict:
+                    yield mm[qp["mnc"]]; return
+            for m in data.values():
+                if type(m) is dict:
+                    yield from (rec for rec in m.values() if type(rec) is dict)
+        elif type(data) is list:
+            yield from (r for r in data if type(r) is dict)
+
+    def _do_search(self, mcc, mnc):
+        # runs on _search_pool; returns (records, log lines)
+        logs = []
         s = self.api.session
         def try_get(qp):
             r = s.get(ENDPOINTS["mccmnc"], params=qp, timeout=30)
             if r.status_code != 200:
                 try:
-                    j = r.json()
+                    j = _loads(r.content)
                     err = j.get("message") or j.get("error") or j
                 except Exception:
                     err = r.text[:400]
                 raise requests.HTTPError(f"{r.status_code} – {err}")
-            return _extract_records(r.json(), qp)
+            return list(self._iter_records(_loads(r.content), qp))
 
         try:
             res = try_get({"mcc": mcc, "mnc": mnc} if mcc else {})
-            self._log(f"HTTP 200 – {len(res)} result(s)")
+            logs.append(f"HTTP 200 – {len(res)} result(s)")
         except Exception as e:
-            self._log(f"Primary request failed: {e}")
+            logs.append(f"Primary request failed: {e}")
             res = []
 
         if not res and mcc and mnc:
-            attempts = [{"mccmnc": f"{mcc}{mnc}"}]
+            codes = [f"{mcc}{mnc}"]
             if mnc.isdigit():
-                attempts += [{"mccmnc": f"{mcc}{mnc.zfill(2)}"}, {"mccmnc": f"{mcc}{mnc.zfill(3)}"}]
-            for qp in attempts:
-                try:
-                    self._log(f"Retrying with {qp}")
-                    res = try_get(qp)
-                    self._log(f"HTTP 200 – {len(res)} result(s)")
-                    if res:
-                        break
-                except Exception as e2:
-                    self._log(f"Retry failed: {e2}")
+                codes += [f"{mcc}{mnc.zfill(2)}", f"{mcc}{mnc.zfill(3)}"]
+            attempts = [{"mccmnc": c} for c in dict.fromkeys(codes)]
+            # Fan the fallbacks out together and keep the first non-empty answer.
+            pool = ThreadPoolExecutor(max_workers=len(attempts))
+            try:
+                futures = {}
+                for qp in attempts:
+                    logs.append(f"Retrying with {qp}")
+                    futures[pool.submit(try_get, qp)] = qp
+                for fut in as_completed(futures):
+                    qp = futures[fut]
+                    try:
+                        res = fut.result()
+                        logs.append(f"{qp}: HTTP 200 – {len(res)} result(s)")
+                        if res:
+                            break
+                    except Exception as e2:
+                        logs.append(f"{qp}: Retry failed: {e2}")
+            finally:
+                pool.shutdown(wait=False, cancel_futures=True)
+        return res, logs
+
+    def _apply_results(self, result, error, key=None):
+        self._busy = False
+        if error is not None:
+            self._log(f"Search failed: {error}")
+            return
+        res, logs = result
+        for line in logs:
+            self._log(line)
         if not res:
             self._log("No results.")
             return
-
-        self._raw_rows = []
+        if key is not None:
+            # Operator data is effectively static; only non-empty answers are kept, so failures are retried.
+            self._cache[key] = res
+            self._cache.move_to_end(key)
+            while len(self._cache) > MCC_CACHE_SIZE:
+                self._cache.popitem(last=False)
+
+        rows = self._raw_rows = []  # (country, brand, operator, bands, notes)
+        add = rows.append
         for r in res:
-            country_name = r.get("countryName") or r.get("country") or ""
-            country_code = r.get("countryCode") or r.get("cc") or ""
-            country_display = f"{country_name} ({country_code})" if (country_name and country_code) else (country_name or country_code)
-            row = {
-                "country": country_display,
-                "brand": r.get("brand",""),
-                "operator": r.get("operator",""),
-                "bands": r.get("bands",""),
-                "notes": r.get("notes",""),
-            }
-            self._raw_rows.append(row)
-            self.table.insert("", "end", values=(row["country"], row["brand"], row["operator"], row["bands"], row["notes"]))
+            g = r.get
+            cn = _first(r, "countryName", "country")
+            cc = _first(r, "countryCode", "cc")
+            add((f"{cn} ({cc})" if (cn and cc) else (cn or cc), g("brand",""), g("operator",""), g("bands",""), g("notes","")))
+        self._bulk_insert(rows)
 
     def export_csv(self):
         if not self._raw_rows:
@@ -1449,10 +1794,9 @@ class MccMncTab(BaseTab):
         p = filedialog.asksaveasfilename(title="Save Results CSV As", defaultextension=".csv", filetypes=[("CSV","*.csv")])
         if not p:
             return
-        import csv
-        with open(p, "w", newline="", encoding="utf-8") as f:
+        with open(p, "w", newline="", encoding="utf-8", buffering=1 << 20) as f:
             w = csv.writer(f); w.writerow(["Country","Brand","Operator","Bands","Notes"])
-            for r in self._raw_rows: w.writerow([r["country"], r["brand"], r["operator"], r["bands"], r["notes"]])
+            w.writerows(self._raw_rows)
         messagebox.showinfo("Export CSV", f"CSV exported to {p}")
 
 # ---------------------- App shell with left-side 'tabs' ----------------------
@@ -1465,6 +1809,7 @@ class LeftTabsApp(tk.Tk):
 
         self.cred = CredentialManager()
         self.api = ApiClient(self.cred)
+        threading.Thread(target=self._warm_up, daemon=True).start()
 
         menubar = tk.Menu(self)
         m_settings = tk.Menu(menubar, tearoff=0)
@@ -1491,19 +1836,35 @@ class LeftTabsApp(tk.Tk):
         }
         self.frames = {}
         self._current = None
+        self._creds_dialog = None
+        self._creds_vars = None
 
         for i, (label, factory) in enumerate(self.tabs.items()):
             b = ttk.Button(self.btns, text=label, command=lambda L=label: self.show(L), width=18)
             b.grid(row=i, column=0, sticky="ew", padx=6, pady=(6 if i==0 else 3, 3))
 
-        self.show("BT Basic")
+        self.after_idle(self.show, "BT Basic")  # let the window shell paint before building the first tab
         self.after(300, self._nudge_creds_if_empty)
 
+    def _warm_up(self):
+        # Open a pooled TLS connection to WiGLE before the first search needs it
+        try:
+            self.api.session.head("https://api.wigle.net/", timeout=5)
+        except Exception:
+            pass
+
     def _nudge_creds_if_empty(self):
         if not self.cred.ready():
             messagebox.showinfo("WiGLE Credentials", "Tip: set your WiGLE credentials (Settings → WiGLE Credentials…)")
 
     def _ask_creds(self):
+        # Built once; later opens refresh the fields and re-show the hidden dialog.
+        dlg = self._creds_dialog
+        if dlg is not None and dlg.winfo_exists():
+            uvar, pvar = self._creds_vars
+            uvar.set(self.cred.user); pvar.set(self.cred.token)
+            dlg.deiconify(); dlg.lift(); dlg.grab_set()
+            return
         top = tk.Toplevel(self); top.title("WiGLE Credentials")
         frm = ttk.Frame(top, padding=12); frm.grid(row=0, column=0)
         ttk.Label(frm, text="WiGLE Username / API Name:").grid(row=0, column=0, sticky="e", padx=(0,8), pady=4)
@@ -1511,21 +1872,29 @@ class LeftTabsApp(tk.Tk):
         uvar = tk.StringVar(value=self.cred.user); pvar = tk.StringVar(value=self.cred.token)
         uent = ttk.Entry(frm, textvariable=uvar, width=40); uent.grid(row=0, column=1, sticky="w")
         pent = ttk.Entry(frm, textvariable=pvar, width=40, show="•"); pent.grid(row=1, column=1, sticky="w")
+        def hide():
+            top.grab_release(); top.withdraw()
         def save_close():
             self.cred.save(uvar.get().strip(), pvar.get().strip())
-            if self.api._session is not None:
-                self.api._session.auth = (self.cred.user, self.cred.token)
-            top.destroy()
+            hide()
         ttk.Button(frm, text="Save", command=save_close).grid(row=2, column=0, columnspan=2, pady=(12,0))
-        top.grab_set(); self.wait_window(top)
+        top.protocol("WM_DELETE_WINDOW", hide)
+        self._creds_vars = (uvar, pvar)
+        self._creds_dialog = top
+        top.grab_set()
 
     def show(self, label):
+        # Tabs are built on first use and kept; switching only hides/re-shows the grid slot.
+        f = self.frames.get(label)
+        if f is not None and f is self._current:
+            return
         if self._current is not None:
-            self._current.pack_forget()
-        if label not in self.frames:
-            self.frames[label] = self.tabs[label]()
-        f = self.frames[label]
-        f.pack(fill="both", expand=True)
+            self._current.grid_remove()
+        if f is None:
+            f = self.frames[label] = self.tabs[label]()
+            f.grid(row=0, column=0, sticky="nsew")
+        else:
+            f.grid()
         self._current = f
 
 if __name__ == "__main__":